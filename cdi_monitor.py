@@ -5,14 +5,27 @@ Shows RPM, CDI Voltage, and Ignition Timing
 """
 
 import serial
-from time import sleep
+from time import sleep, strftime
 import struct
-from datetime import datetime
 import sys
 import argparse
+from typing import Optional, Union
 
 # message that we have to send every time to receive a response from a CDI
-MESSAGE_TO_CDI = [0x01, 0xAB, 0xAC, 0xA1]
+MESSAGE_TO_CDI = bytes([0x01, 0xAB, 0xAC, 0xA1])
+
+# Unpacks all fields of interest in one C call:
+# skip header byte 0, RPM at bytes 1-2 (big-endian), skip reserved
+# bytes 3-6, voltage at byte 7, skip bytes 8-12, timing at byte 13
+_PACKET_FIELDS = struct.Struct('>xH4xB5xB')
+
+# Packet header and end marker
+_PACKET_HEAD = b'\x03'
+_PACKET_TAIL = b'\xa9'
+
+# Row template built once - a single .format() call renders a row
+_ROW_FMT = "{ts} | {rpm:4d} | {volt:^8} | {timing:^6.1f} | {raw}"
+_ROW_INVALID_FMT = "{ts} | {0:^4} | {0:^8} | {0:^6} | {0:^11}"
 
 def connect_to_cdi(port_name='COM5'):
   """Connect to the CDI module
@@ -26,35 +39,41 @@ def connect_to_cdi(port_name='COM5'):
   port = serial.Serial(
     port=port_name,
     baudrate=19200, # CDI uses 19200 baud
-    timeout=1.0
+    timeout=0.25 # blocking read returns as soon as the packet lands
   )
   
   # IMPORTANT: Set DTR and RTS high (required for CDI)
   port.dtr = True
   port.rts = True
 
+  # FTDI USB-serial adapters buffer incoming bytes for ~16 ms by
+  # default; low latency mode delivers them right away. Not every
+  # platform/driver supports it, so failures are ignored.
+  try:
+    port.set_low_latency_mode(True)
+  except (NotImplementedError, OSError, ValueError):
+    pass
+
   return port
 
-def decode_cdi_packet(data):
+def decode_cdi_packet(data: Union[bytes, bytearray]) -> Optional[dict]:
   """
   Decode CDI packet to get RPM, CDI voltage, and Timing
   This is a simplified decoder for beginners
   """
-  # Check if packet is valid (starts with 0x03, ends with 0xA9)
-  if len(data) != 22 or data[0] != 0x03 or data[21] != 0xA9:
+  # Check if packet is valid (starts with 0x03, ends with 0xA9).
+  # startswith/endswith compare the bytes in C, without pulling each
+  # byte out as a Python int first
+  if len(data) != 22 or not (data.startswith(_PACKET_HEAD) and data.endswith(_PACKET_TAIL)):
     return None
   
-  # Extract RPM (bytes 1-2, big-endian format)
-  # Big-endian means most significant byte first
-  rpm = (data[1] << 8) | data[2]  # Combine two bytes into one number
-  
-  # Extract CDI Voltage (byte 7)
-  # Stored as decivolts (e.g., 115 = 11.5V)
-  cdi_voltage_decivolts = data[7]
+  # One struct call pulls out RPM (big-endian), voltage and timing
+  rpm, cdi_voltage_decivolts, timing_byte = _PACKET_FIELDS.unpack_from(data)
+
+  # Voltage is stored as decivolts (e.g., 115 = 11.5V)
   cdi_voltage = cdi_voltage_decivolts / 10.0
-  
-  
-  timing_angle = data[13] / 2
+
+  timing_angle = timing_byte / 2
 
   return {
     'rpm': rpm,
@@ -62,31 +81,83 @@ def decode_cdi_packet(data):
     'timing byte': timing_angle
   }
 
-def connect_and_read_data(port_name):
+class CDIMonitor:
+  """Owns the serial connection and the state of the polling loop"""
+
+  def __init__(self, port_name):
+    self.port = connect_to_cdi(port_name)
+
+    # Bind the per-iteration callables and the receive buffer once -
+    # a LOAD_FAST on a prebound local is cheaper inside the hot loop
+    # than resolving port.write/port.readinto through descriptors on
+    # every poll
+    self._write = self.port.write
+    self._readinto = self.port.readinto
+    self._reset_input = self.port.reset_input_buffer
+    # One receive buffer reused for every poll - the loop runs for
+    # hours, so a fresh bytes object per read adds up to GC churn
+    self._buf = bytearray(22)
+    self._mv = memoryview(self._buf)
+
+  def close(self):
+    self.port.close()
+
+  def run(self, quiet=False, csv_file=None):
+    """Poll the CDI until interrupted
+
+    Args:
+      quiet: skip the pretty-printed table (useful for headless logging)
+      csv_file: optional open file object to append CSV samples to
+    """
+    write = self._write
+    readinto = self._readinto
+    reset_input = self._reset_input
+    data = self._buf
+    mv = self._mv
 
-  try:
-    # Connect to CDI
-    port = connect_to_cdi(port_name)
-    print("\nStarting monitor...\n")
-    
-    pretty_header()
-    
     while True:
-      for byte in MESSAGE_TO_CDI:
-        port.write(bytes([byte]))
-      
-      # Wait a bit
-      sleep(0.1)
-      
-      # Read response if available
-      if port.in_waiting >= 22: # CDI sends 22-byte packets
-        data = port.read(22)
-        
-        pretty_print(data)
-        
-      
+      # Drop any frames that queued up in the kernel buffer while we
+      # slept, so what we decode is the answer to this request and
+      # not a stale sample from seconds ago
+      reset_input()
+      write(MESSAGE_TO_CDI)
+
+      # Fills the buffer in place; returns once all 22 bytes arrived
+      # or the port timeout expired
+      n = readinto(mv)
+
+      if n == 22 and data[0] == 0x03 and data[21] == 0xA9:
+        # Formatting the table row is skipped entirely in quiet mode
+        if not quiet:
+          pretty_print(data)
+        if csv_file is not None:
+          decoded_message = decode_cdi_packet(data)
+          if decoded_message is not None:
+            csv_file.write(f"{strftime('%H:%M:%S')},{decoded_message['rpm']},{decoded_message['cdi_voltage']},{decoded_message['timing byte']}\n")
+      # A short or misaligned frame needs no handling of its own -
+      # the flush at the top of the next iteration resyncs the stream
+
       # Wait before next request
       sleep(0.1)
+
+
+def connect_and_read_data(port_name, quiet=False, csv_file=None):
+  """Read packets in a loop and render them
+
+  Args:
+    port_name: Serial port name to connect to
+    quiet: skip the pretty-printed table (useful for headless logging)
+    csv_file: optional open file object to append CSV samples to
+  """
+  try:
+    # Connect to CDI
+    monitor = CDIMonitor(port_name)
+    print("\nStarting monitor...\n")
+
+    if not quiet:
+      pretty_header()
+
+    monitor.run(quiet, csv_file)
       
   except KeyboardInterrupt:
     print("\n\nStopped by user")
@@ -102,8 +173,8 @@ def connect_and_read_data(port_name):
     
   finally:
     # Close the port
-    if 'port' in locals():
-      port.close()
+    if 'monitor' in locals():
+      monitor.close()
       print("Port closed")
 
 
@@ -113,11 +184,13 @@ def connect_and_read_data(port_name):
 #
 ###
 
-def main(port_name='COM5'):
+def main(port_name='COM5', quiet=False, csv_path=None):
   """Main program
-  
+
   Args:
     port_name: Serial port name to connect to
+    quiet: don't pretty-print samples to the terminal
+    csv_path: optional path of a CSV file to log samples to
   """
   print("="*70)
   print("CDI Monitor with Decoding")
@@ -127,19 +200,29 @@ def main(port_name='COM5'):
   print("  • CDI Voltage")
   print("  • Ignition Timing")
   print("\nPress Ctrl+C to stop\n")
-  
-  while True:
-    try:
-      # In case user stops the program in the read loop of a connect_and_read_data function - let's just break the loop here as well and finish operation.
-      if (connect_and_read_data(port_name)):
+
+  # Buffered log file so each sample doesn't cost a disk write
+  csv_file = None
+  if csv_path:
+    csv_file = open(csv_path, 'w', buffering=8192)
+    csv_file.write("time,rpm,cdi_voltage,timing\n")
+
+  try:
+    while True:
+      try:
+        # In case user stops the program in the read loop of a connect_and_read_data function - let's just break the loop here as well and finish operation.
+        if (connect_and_read_data(port_name, quiet, csv_file)):
+          break
+      except serial.SerialException as e:
+        print(f"\nConnection lost, retrying (main loop). Error message:\n{e}")
+        sleep(1)
+      # This exception happens when tuner usb cable isn't connected and user cancels the program.
+      except KeyboardInterrupt:
+        print("\n\nStopped by user (main loop)")
         break
-    except serial.SerialException as e:
-      print(f"\nConnection lost, retrying (main loop). Error message:\n{e}")
-      sleep(1)
-    # This exception happens when tuner usb cable isn't connected and user cancels the program.
-    except KeyboardInterrupt:
-      print("\n\nStopped by user (main loop)")
-      break
+  finally:
+    if csv_file:
+      csv_file.close()
 
 
 ###
@@ -148,28 +231,27 @@ def main(port_name='COM5'):
 #
 ###
 
+# Captured packets used by test(), parsed from hex once at import time
+_TEST_PACKETS = tuple(bytes.fromhex(a) for a in (
+  "030000000000007210040008000a020103020201a6a9",
+  "030300000000007210040008000a020103020201a9a9",
+  "030300000000007210040008000a020103020201a9a9",
+  "030d40000000007f0660000800220201030202016aa9",
+  "03078000000000780cff0009001102010403020134a9",
+  "0303c000000000740da50008000a02010302020109a9",
+  "0302c000000000730d9c0008000a020103020201fea9"
+))
+
+
 def test():
   """
   Test how results are being displayed
   """
-
-  test_data = [
-    "030000000000007210040008000a020103020201a6a9",
-    "030300000000007210040008000a020103020201a9a9",
-    "030300000000007210040008000a020103020201a9a9",
-    "030d40000000007f0660000800220201030202016aa9",
-    "03078000000000780cff0009001102010403020134a9",
-    "0303c000000000740da50008000a02010302020109a9",
-    "0302c000000000730d9c0008000a020103020201fea9"
-  ]
-  
   pretty_header()
-  
-  for a in test_data:
-    # decoded = decode_cdi_packet()
-    # pretty_print(decoded)
 
-    pretty_print(bytes.fromhex(a))
+  # Build all rows first and emit them with a single stdout write
+  rows = [format_row(pkt) for pkt in _TEST_PACKETS]
+  sys.stdout.write("\n".join(rows) + "\n")
 
 
 ###
@@ -200,30 +282,40 @@ def pretty_header():
     print("-" * 70)
 
 
-def pretty_print(bytes):
+def format_row(data: Union[bytes, bytearray]) -> str:
   """
-  Pretty print CDI message in a formatted table row
-  
+  Format CDI message as a table row string
+
   Args:
-    bytes: Raw bytes - a message received from a CDI. It will be decoded to a dictionary with keys 'rpm', 'cdi_voltage', 'timing byte', 'status_byte' or None if packet was invalid
+    data: Raw bytes - a message received from a CDI. It will be decoded to a dictionary with keys 'rpm', 'cdi_voltage', 'timing byte', 'status_byte' or None if packet was invalid
   """
-  decoded_message = decode_cdi_packet(bytes)
+  decoded_message = decode_cdi_packet(data)
+  # strftime from the time module skips building a datetime object
+  timestamp = strftime("%H:%M:%S")
+
   if decoded_message is None:
-    # Invalid packet - print error row
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    print(f"{timestamp} | {'---':^4} | {'---':^8} | {'---':^6} | {'---':^11}")
-    return
-  
-  # Get current time
-  timestamp = datetime.now().strftime("%H:%M:%S")
-  
-  # Format each field with proper width and alignment
-  rpm_str = f"{decoded_message['rpm']:4d}"  # 4 digits, right aligned
-  cdi_voltage_str = f"{decoded_message['cdi_voltage']:5.1f}V"  # 5 chars total with 1 decimal
-  timing_angle = f"{decoded_message['timing byte']:2.1f}" # Timing in degrees
-  
-  # Print the formatted row with bytes 8 and 9 highlighted in red
-  print(f"{timestamp} | {rpm_str} | {cdi_voltage_str:^8} | {timing_angle:^6} | {format_hex(bytes, highlight={8, 9})}")
+    # Invalid packet - format an error row
+    return _ROW_INVALID_FMT.format('---', ts=timestamp)
+
+  # One format call renders the whole row, with bytes 8 and 9 of the
+  # raw message highlighted in red
+  return _ROW_FMT.format(
+    ts=timestamp,
+    rpm=decoded_message['rpm'],
+    volt=f"{decoded_message['cdi_voltage']:5.1f}V",
+    timing=decoded_message['timing byte'],
+    raw=format_hex(data, highlight={8, 9})
+  )
+
+
+def pretty_print(data: Union[bytes, bytearray]) -> None:
+  """
+  Pretty print CDI message in a formatted table row
+
+  Args:
+    data: Raw bytes - a message received from a CDI
+  """
+  print(format_row(data))
 
 
 ###
@@ -251,12 +343,24 @@ Examples:
     default='COM5',
     help='Serial port name (default: COM5)'
   )
-  
+
+  parser.add_argument(
+    '--quiet',
+    action='store_true',
+    help='do not print the live table (for headless logging)'
+  )
+
+  parser.add_argument(
+    '--csv',
+    metavar='PATH',
+    help='log samples to a CSV file at PATH'
+  )
+
   # Parse arguments
   args = parser.parse_args()
-  
+
   # Check if running in test mode
   if args.port == 'test':
     test()
   else:
-    main(args.port)
+    main(args.port, quiet=args.quiet, csv_path=args.csv)
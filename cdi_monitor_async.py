@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+"""
+Asyncio variant of the CDI monitor
+Reads and displays CDI data without blocking the event loop, so other
+tasks (logging, a future GUI or network readout) can run while we wait
+for the serial port.
+
+Requires the pyserial-asyncio package.
+"""
+
+import asyncio
+import sys
+import argparse
+
+import serial_asyncio
+
+from cdi_monitor import MESSAGE_TO_CDI, pretty_header, pretty_print
+
+
+async def read_packet(reader):
+  """Wait for one complete 22-byte CDI packet"""
+  return await reader.readexactly(22)
+
+
+async def main_async(port_name):
+  """Main monitor loop - request, read, decode, display"""
+  print(f"Connecting to CDI on {port_name}...")
+
+  reader, writer = await serial_asyncio.open_serial_connection(
+    url=port_name,
+    baudrate=19200 # CDI uses 19200 baud
+  )
+
+  # IMPORTANT: Set DTR and RTS high (required for CDI)
+  serial_port = writer.transport.serial
+  serial_port.dtr = True
+  serial_port.rts = True
+
+  print("\nStarting monitor...\n")
+  pretty_header()
+
+  while True:
+    writer.write(MESSAGE_TO_CDI)
+    await writer.drain()
+
+    try:
+      data = await asyncio.wait_for(read_packet(reader), timeout=1.0)
+    except asyncio.TimeoutError:
+      # No response in time - ask again
+      continue
+
+    pretty_print(data)
+
+    # Pacing between requests; other tasks can run during the wait
+    await asyncio.sleep(0.1)
+
+
+def main(port_name):
+  try:
+    asyncio.run(main_async(port_name))
+  except KeyboardInterrupt:
+    print("\n\nStopped by user")
+
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(
+    description='CDI Monitor (asyncio) - Read and display CDI data in real-time'
+  )
+
+  parser.add_argument(
+    'port',
+    nargs='?',  # Makes it optional
+    default='COM5',
+    help='Serial port name (default: COM5)'
+  )
+
+  args = parser.parse_args()
+  main(args.port)
@@ -115,7 +115,14 @@ def main():
   )
   port.dtr = True
   port.rts = True
-  
+
+  # FTDI adapters hold received bytes for ~16 ms by default; low
+  # latency mode hands them over immediately where supported
+  try:
+    port.set_low_latency_mode(True)
+  except (NotImplementedError, OSError, ValueError):
+    pass
+
   print(f"Reading ignition map from {port_name}...")
   
   message_bytes = read_all_CDI_timing_messages(port)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+"""
+CDI Ignition Map Write Tool
+Writes ignition map values to API Tech CDI via serial communication.
+
+Protocol (from COM port sniffing):
+1. Send the write command byte 0x0D
+2. Follow with 16 values, 2 bytes each, Little Endian
+The UART paces the bytes at the configured baud rate, so the whole
+payload can go out in a single write.
+"""
+
+import serial
+import struct
+import sys
+
+import numpy as np
+
+# Compiled once so every write reuses the same format parser
+_MAP_PACKER = struct.Struct('<16H')
+
+# 16 values captured from a tuner program sniff - 11 RPM points
+# followed by 5 timing values
+TEST_VALUES = (
+  4730, 6375, 7573, 8914, 10268, 11336,
+  11926, 12891, 13975, 15070, 16000,
+  600, 631, 1086, 1817, 2456
+)
+
+# On-wire form of TEST_VALUES, packed once at import time
+_TEST_BYTES = _MAP_PACKER.pack(*TEST_VALUES)
+
+
+class CDIIgnitionMap:
+  """Handles the serial connection and map writes to the CDI"""
+
+  def __init__(self, port_name):
+    self.port_name = port_name
+    self.ser = None
+
+  def connect(self):
+    """Open the serial port with the settings the CDI expects"""
+    print(f"Connecting to CDI on {self.port_name}...")
+
+    self.ser = serial.Serial(
+      port=self.port_name,
+      baudrate=19200, # CDI uses 19200 baud
+      timeout=1.0
+    )
+
+    # IMPORTANT: Set DTR and RTS high (required for CDI)
+    self.ser.dtr = True
+    self.ser.rts = True
+
+    # Ask the FTDI driver to skip its ~16 ms receive buffering timer;
+    # ignored where the platform/driver doesn't support it
+    try:
+      self.ser.set_low_latency_mode(True)
+    except (NotImplementedError, OSError, ValueError):
+      pass
+
+  def disconnect(self):
+    """Close the serial port"""
+    if self.ser:
+      self.ser.close()
+      self.ser = None
+      print("Port closed")
+
+  def write_ignition_map(self, test_values):
+    """Send 16 map values to the CDI as one bulk write
+
+    Args:
+      test_values: 16 integer values to send (list or numpy array)
+    """
+    # Build the whole payload up front: command byte plus all values
+    # as 16-bit Little Endian. The array already has the on-wire
+    # layout, so tobytes() is one memcpy with no per-value packing.
+    # One write() call streams it and the UART provides the pacing.
+    data_bytes = np.ascontiguousarray(test_values, dtype='<u2').tobytes()
+    self.ser.write(b'\x0D' + data_bytes)
+    # Wait until the payload has left the transmit buffer before
+    # anything else touches the port - no artificial sleeps needed,
+    # the UART already paces the bytes at ~520 us each at 19200 baud
+    self.ser.flush()
+
+    # Diagnostic output, kept separate from the I/O so printing does
+    # not slow down the transfer; one stdout write for the whole block
+    lines = [
+      f"  Value {i}: {value:5d} = 0x{value:04X} -> {value & 0xFF:02X} {(value >> 8) & 0xFF:02X}"
+      for i, value in enumerate(test_values)
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+  def test_protocol(self):
+    """Replay the sniffed write sequence in a single write"""
+    print("Replaying sniffed sequence...")
+    self.ser.write(b'\x0D' + _TEST_BYTES)
+    self.ser.flush()
+
+    # Show what was sent, two bytes at a time, in one stdout write
+    lines = [
+      f"  Bytes {_TEST_BYTES[2 * i]:02X} {_TEST_BYTES[2 * i + 1]:02X} = {value:5d}"
+      for i, value in enumerate(TEST_VALUES)
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def parse_cfg_file(filename):
+  """Parse a tuner program .cfg export into a flat array of values
+
+  The .cfg is tab-separated integers (see 'ignition map from tuner
+  program.cfg'). Rows alternate between timing and RPM values padded
+  with zeros, and the last row holds a few extra settings. The whole
+  file is split and converted in bulk by numpy instead of looping over
+  lines and tokens in Python.
+
+  Args:
+    filename: path to the .cfg file
+  """
+  with open(filename) as f:
+    # '<u2' is the on-wire format (16-bit Little Endian), so the
+    # array can later be sent with tobytes() without any repacking
+    return np.array(f.read().split(), dtype='<u2')
+
+
+def main():
+  if len(sys.argv) < 2:
+    print("Usage: python cdi_write_ignition_map.py <COM_PORT>")
+    print("Example: python cdi_write_ignition_map.py COM4")
+    return 1
+
+  cdi = CDIIgnitionMap(sys.argv[1])
+  cdi.connect()
+
+  try:
+    cdi.write_ignition_map(TEST_VALUES)
+  finally:
+    cdi.disconnect()
+
+  return 0
+
+if __name__ == "__main__":
+  sys.exit(main())